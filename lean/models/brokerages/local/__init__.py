@@ -12,7 +12,8 @@
 # limitations under the License.
 
 from os import environ
-from typing import Dict, Type, List
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 from lean.container import container
 from lean.models.brokerages.local.local_brokerage import LocalBrokerage
 from lean.models.brokerages.local.data_feed import DataFeed
@@ -20,8 +21,6 @@ from lean.models import json_modules
 
 all_local_brokerages: List[LocalBrokerage] = []
 all_local_data_feeds: List[DataFeed] = []
-local_brokerage_data_feeds: Dict[Type[LocalBrokerage],
-                                 List[Type[DataFeed]]] = {}
 
 for json_module in json_modules:
     if "local-brokerage" in json_module["type"]:
@@ -29,10 +28,16 @@ for json_module in json_modules:
     if "data-queue-handler" in json_module["type"]:
         all_local_data_feeds.append(DataFeed(json_module))
 
+# The README generator documents every data feed, regardless of the platform it runs on
+_generating_readme = environ.get("__README__", "false") == "true"
+
 # Remove IQFeed DataFeed for other than windows machines
-if not [container.platform_manager.is_host_windows() or environ.get("__README__", "false") == "true"]:
+if not [container.platform_manager.is_host_windows() or _generating_readme]:
     all_local_data_feeds = [
         data_feed for data_feed in all_local_data_feeds if data_feed._id != "IQFeed"]
 
-for local_brokerage in all_local_brokerages:
-    local_brokerage_data_feeds[local_brokerage] = all_local_data_feeds
+# Every local brokerage supports the same data feeds, so they all share a single read-only tuple
+_shared_local_data_feeds: Tuple[DataFeed, ...] = tuple(all_local_data_feeds)
+local_brokerage_data_feeds: Mapping[LocalBrokerage, Tuple[DataFeed, ...]] = MappingProxyType({
+    local_brokerage: _shared_local_data_feeds for local_brokerage in all_local_brokerages
+})
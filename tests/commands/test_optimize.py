@@ -54,7 +54,7 @@ def _get_optimizer_config_manager_mock() -> mock.Mock:
 
 
 def run_image(image: DockerImage, **kwargs) -> bool:
-    results_path = next(key for key in kwargs["volumes"].keys() if kwargs["volumes"][key]["bind"] == "/Results")
+    results_path = next(key for key, volume in kwargs["volumes"].items() if volume["bind"] == "/Results")
     (Path(results_path) / "log.txt").touch()
     return True
 
@@ -117,7 +117,7 @@ def test_optimize_mounts_optimizer_config() -> None:
     docker_manager.run_image.assert_called_once()
     args, kwargs = docker_manager.run_image.call_args
 
-    assert any([mount["Target"] == "/Lean/Optimizer.Launcher/bin/Debug/config.json" for mount in kwargs["mounts"]])
+    assert any(mount["Target"] == "/Lean/Optimizer.Launcher/bin/Debug/config.json" for mount in kwargs["mounts"])
 
 
 def test_optimize_mounts_lean_config() -> None:
@@ -137,7 +137,7 @@ def test_optimize_mounts_lean_config() -> None:
     docker_manager.run_image.assert_called_once()
     args, kwargs = docker_manager.run_image.call_args
 
-    assert any([mount["Target"] == f"{LEAN_ROOT_PATH}/config.json" for mount in kwargs["mounts"]])
+    assert any(mount["Target"] == f"{LEAN_ROOT_PATH}/config.json" for mount in kwargs["mounts"])
 
 
 def test_optimize_mounts_data_directory() -> None:
@@ -157,9 +157,9 @@ def test_optimize_mounts_data_directory() -> None:
     docker_manager.run_image.assert_called_once()
     args, kwargs = docker_manager.run_image.call_args
 
-    assert any([volume["bind"] == "/Lean/Data" for volume in kwargs["volumes"].values()])
+    assert any(volume["bind"] == "/Lean/Data" for volume in kwargs["volumes"].values())
 
-    key = next(key for key in kwargs["volumes"].keys() if kwargs["volumes"][key]["bind"] == "/Lean/Data")
+    key = next(key for key, volume in kwargs["volumes"].items() if volume["bind"] == "/Lean/Data")
     assert key == str(Path.cwd() / "data")
 
 
@@ -180,9 +180,9 @@ def test_optimize_mounts_output_directory() -> None:
     docker_manager.run_image.assert_called_once()
     args, kwargs = docker_manager.run_image.call_args
 
-    assert any([volume["bind"] == "/Results" for volume in kwargs["volumes"].values()])
+    assert any(volume["bind"] == "/Results" for volume in kwargs["volumes"].values())
 
-    key = next(key for key in kwargs["volumes"].keys() if kwargs["volumes"][key]["bind"] == "/Results")
+    key = next(key for key, volume in kwargs["volumes"].items() if volume["bind"] == "/Results")
     assert key == str(Path.cwd() / "output")
 
 
@@ -351,7 +351,7 @@ def test_optimize_creates_correct_config_from_given_optimizer_config() -> None:
     mount = next(m for m in kwargs["mounts"] if m["Target"] == "/Lean/Optimizer.Launcher/bin/Debug/config.json")
     config = json.loads(Path(mount["Source"]).read_text(encoding="utf-8"))
 
-    assert not any([key.startswith("algorithm-") for key in config.keys()])
+    assert not any(key.startswith("algorithm-") for key in config.keys())
 
     assert config["results-destination-folder"] == "/Results"
 
@@ -709,7 +709,7 @@ DATA USAGE:: Failed universe data requests percentage 0%
     Storage(str(Path.cwd() / "Python Project" / "config.json")).set("parameters", {"param1": "1"})
 
     def run_image_for_estimate(image: DockerImage, **kwargs) -> bool:
-        results_path = next(key for key in kwargs["volumes"].keys() if kwargs["volumes"][key]["bind"] == "/Results")
+        results_path = next(key for key, volume in kwargs["volumes"].items() if volume["bind"] == "/Results")
         log_file = Path(results_path) / "log.txt"
         with log_file.open("w+", encoding="utf-8") as logs:
             logs.write("""
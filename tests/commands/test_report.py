@@ -51,7 +51,7 @@ def run_image(image: DockerImage, **kwargs) -> bool:
     config_mount = [mount for mount in kwargs["mounts"] if mount["Target"] == "/Lean/Report/bin/Debug/config.json"][0]
     config = json.loads(Path(config_mount["Source"]).read_text(encoding="utf-8"))
 
-    results_path = next(key for key in kwargs["volumes"].keys() if kwargs["volumes"][key]["bind"] == "/Output")
+    results_path = next(key for key, volume in kwargs["volumes"].items() if volume["bind"] == "/Output")
 
     output_file = Path(results_path) / Path(config["report-destination"]).name
     output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -149,7 +149,7 @@ def test_report_mounts_report_config() -> None:
     docker_manager.run_image.assert_called_once()
     args, kwargs = docker_manager.run_image.call_args
 
-    assert any([mount["Target"] == "/Lean/Report/bin/Debug/config.json" for mount in kwargs["mounts"]])
+    assert any(mount["Target"] == "/Lean/Report/bin/Debug/config.json" for mount in kwargs["mounts"])
 
 
 def test_report_mounts_data_directory() -> None:
@@ -166,9 +166,9 @@ def test_report_mounts_data_directory() -> None:
     docker_manager.run_image.assert_called_once()
     args, kwargs = docker_manager.run_image.call_args
 
-    assert any([volume["bind"] == "/Lean/Data" for volume in kwargs["volumes"].values()])
+    assert any(volume["bind"] == "/Lean/Data" for volume in kwargs["volumes"].values())
 
-    key = next(key for key in kwargs["volumes"].keys() if kwargs["volumes"][key]["bind"] == "/Lean/Data")
+    key = next(key for key, volume in kwargs["volumes"].items() if volume["bind"] == "/Lean/Data")
     assert key == str(Path.cwd() / "data")
 
 
@@ -186,7 +186,7 @@ def test_report_mounts_output_directory() -> None:
     docker_manager.run_image.assert_called_once()
     args, kwargs = docker_manager.run_image.call_args
 
-    assert any([volume["bind"] == "/Output" for volume in kwargs["volumes"].values()])
+    assert any(volume["bind"] == "/Output" for volume in kwargs["volumes"].values())
 
 
 def test_report_mounts_given_backtest_data_source_file() -> None:
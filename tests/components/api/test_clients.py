@@ -139,7 +139,7 @@ def test_projects_crud() -> None:
 
     # Test the project is really deleted
     projects = project_client.get_all()
-    assert not any([p.projectId == created_project.projectId for p in projects])
+    assert not any(p.projectId == created_project.projectId for p in projects)
 
 
 def test_files_crud() -> None:
@@ -172,7 +172,7 @@ def test_files_crud() -> None:
         # Test the file is really deleted
         files = file_client.get_all(project.projectId)
 
-        assert not any([file.name == "file.py" for file in files])
+        assert not any(file.name == "file.py" for file in files)
 
 
 def test_compiling() -> None:
@@ -243,7 +243,7 @@ def test_backtest_crud() -> None:
         # Test the backtest is really deleted
         backtests = backtest_client.get_all(project.projectId)
 
-        assert not any([backtest.backtestId == created_backtest.backtestId for backtest in backtests])
+        assert not any(backtest.backtestId == created_backtest.backtestId for backtest in backtests)
 
 
 def test_live_client_get_all_parses_response() -> None:
@@ -0,0 +1,114 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean CLI v1.0. Copyright 2021 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path, PurePath
+from typing import Dict
+from unittest import mock
+
+import pytest
+
+from lean.components.config.lean_config_manager import LeanConfigManager
+from lean.components.config.output_config_manager import OutputConfigManager
+from lean.components.config.project_config_manager import ProjectConfigManager
+from lean.components.config.storage import Storage
+from lean.components.docker.lean_runner import LeanRunner
+from lean.components.util.path_manager import PathManager
+from lean.components.util.platform_manager import PlatformManager
+from lean.components.util.project_manager import ProjectManager
+from lean.components.util.temp_manager import TempManager
+from lean.components.util.xml_manager import XMLManager
+from lean.models.modules import NuGetPackage
+from tests.test_helpers import create_fake_lean_cli_directory_from_files, get_fake_lean_cli_directory_files
+
+
+@pytest.fixture(scope="session")
+def fake_cli_files() -> Dict[PurePath, str]:
+    """A pytest fixture which renders the contents of the files of a fake Lean CLI directory once per test session.
+
+    The files still need to be written in every test, see fake_cli_dir.
+    The paths are relative, because Path instances are bound to the fake filesystem of the test that created them.
+    """
+    return get_fake_lean_cli_directory_files(PurePath())
+
+
+@pytest.fixture
+def fake_cli_dir(fake_cli_files: Dict[PurePath, str]) -> Path:
+    """A pytest fixture which writes the fake Lean CLI directory to the cwd and returns the cwd."""
+    create_fake_lean_cli_directory_from_files(fake_cli_files)
+    return Path.cwd()
+
+
+@pytest.fixture(scope="session")
+def xml_manager() -> XMLManager:
+    """A pytest fixture which provides an XMLManager shared by all tests, as it holds no per-test state."""
+    return XMLManager()
+
+
+@pytest.fixture(scope="session")
+def platform_manager() -> PlatformManager:
+    """A pytest fixture which provides a PlatformManager shared by all tests, as it holds no per-test state."""
+    return PlatformManager()
+
+
+@pytest.fixture
+def docker_manager() -> mock.Mock:
+    """A pytest fixture which provides a mocked DockerManager on which running images succeeds."""
+    docker_manager = mock.Mock()
+    docker_manager.run_image.return_value = True
+    return docker_manager
+
+
+@pytest.fixture
+def lean_runner(docker_manager: mock.Mock, xml_manager: XMLManager, platform_manager: PlatformManager) -> LeanRunner:
+    """A pytest fixture which provides a LeanRunner that runs its images on the docker_manager fixture.
+
+    Components which depend on the filesystem are created for each test,
+    because Path instances are bound to the filesystem that was active at the time of their creation.
+    """
+    logger = mock.Mock()
+    logger.debug_logging_enabled = False
+
+    cli_config_manager = mock.Mock()
+    cli_config_manager.user_id.get_value.return_value = "123"
+    cli_config_manager.api_token.get_value.return_value = "456"
+
+    project_config_manager = ProjectConfigManager(xml_manager)
+
+    cache_storage = Storage(str(Path("~/.lean/cache").expanduser()))
+    lean_config_manager = LeanConfigManager(logger,
+                                            cli_config_manager,
+                                            project_config_manager,
+                                            mock.Mock(),
+                                            cache_storage)
+    output_config_manager = OutputConfigManager(lean_config_manager)
+
+    module_manager = mock.Mock()
+    module_manager.get_installed_packages.return_value = [NuGetPackage(name="QuantConnect.Brokerages", version="1.0.0")]
+
+    path_manager = PathManager(lean_config_manager, platform_manager)
+    project_manager = ProjectManager(logger,
+                                     project_config_manager,
+                                     lean_config_manager,
+                                     path_manager,
+                                     xml_manager,
+                                     platform_manager)
+
+    return LeanRunner(logger,
+                      project_config_manager,
+                      lean_config_manager,
+                      output_config_manager,
+                      docker_manager,
+                      module_manager,
+                      project_manager,
+                      TempManager(),
+                      xml_manager)
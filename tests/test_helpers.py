@@ -13,8 +13,8 @@
 
 import json
 from datetime import datetime
-from pathlib import Path
-from typing import List
+from pathlib import Path, PurePath
+from typing import Dict, List
 
 from lean.commands.create_project import (DEFAULT_CSHARP_MAIN, DEFAULT_CSHARP_NOTEBOOK, DEFAULT_PYTHON_MAIN,
                                           DEFAULT_PYTHON_NOTEBOOK, LIBRARY_PYTHON_MAIN, LIBRARY_CSHARP_MAIN)
@@ -23,7 +23,7 @@ from lean.models.api import QCLanguage, QCProject, QCFullOrganization, \
     QCOrganizationData, QCOrganizationCredit, QCNode, QCNodeList, QCNodePrice, QCLeanEnvironment
 
 
-def _get_python_project_files(path: Path) -> dict:
+def _get_python_project_files(path: PurePath) -> dict:
     return {
         (path / "main.py"): DEFAULT_PYTHON_MAIN.replace("$CLASS_NAME$", "PythonProject"),
         (path / "research.ipynb"): DEFAULT_PYTHON_NOTEBOOK,
@@ -34,7 +34,7 @@ def _get_python_project_files(path: Path) -> dict:
     }
 
 
-def _get_csharp_project_files(path: Path) -> dict:
+def _get_csharp_project_files(path: PurePath) -> dict:
     return {
         (path / "Main.cs"): DEFAULT_CSHARP_MAIN.replace("$CLASS_NAME$", "CSharpProject"),
         (path / "research.ipynb"): DEFAULT_CSHARP_NOTEBOOK,
@@ -46,23 +46,23 @@ def _get_csharp_project_files(path: Path) -> dict:
     }
 
 
-def _get_fake_libraries() -> dict:
+def _get_fake_libraries(path: PurePath) -> dict:
     return {
-        (Path.cwd() / "Library" / "Python Library" / "main.py"):
+        (path / "Library" / "Python Library" / "main.py"):
             LIBRARY_PYTHON_MAIN.replace("$CLASS_NAME$", "PythonLibrary"),
-        (Path.cwd() / "Library" / "Python Library" / "research.ipynb"): DEFAULT_PYTHON_NOTEBOOK,
-        (Path.cwd() / "Library" / "Python Library" / "config.json"): json.dumps({
+        (path / "Library" / "Python Library" / "research.ipynb"): DEFAULT_PYTHON_NOTEBOOK,
+        (path / "Library" / "Python Library" / "config.json"): json.dumps({
             "algorithm-language": "Python",
             "parameters": {}
         }),
-        (Path.cwd() / "Library" / "CSharp Library" / "Main.cs"):
+        (path / "Library" / "CSharp Library" / "Main.cs"):
             LIBRARY_CSHARP_MAIN.replace("$CLASS_NAME$", "CSharpLibrary"),
-        (Path.cwd() / "Library" / "CSharp Library" / "research.ipynb"): DEFAULT_CSHARP_NOTEBOOK,
-        (Path.cwd() / "Library" / "CSharp Library" / "config.json"): json.dumps({
+        (path / "Library" / "CSharp Library" / "research.ipynb"): DEFAULT_CSHARP_NOTEBOOK,
+        (path / "Library" / "CSharp Library" / "config.json"): json.dumps({
             "algorithm-language": "CSharp",
             "parameters": {}
         }),
-        (Path.cwd() / "Library" / "CSharp Library" / "CSharp Library.csproj"):
+        (path / "Library" / "CSharp Library" / "CSharp Library.csproj"):
             ProjectManager.get_csproj_file_default_content()
     }
 
@@ -86,19 +86,31 @@ def _get_lean_config_file_content() -> str:
 """
 
 
+def get_fake_lean_cli_directory_files(path: PurePath) -> dict:
+    """Returns the files of a directory structure similar to the one created by `lean init` with a Python and a C#
+    project, and a Python and a C# library, rooted at the given path"""
+    return {
+        (path / "lean.json"): _get_lean_config_file_content(),
+        **_get_python_project_files(path / "Python Project"),
+        **_get_csharp_project_files(path / "CSharp Project"),
+        **_get_fake_libraries(path)
+    }
+
+
 def create_fake_lean_cli_directory() -> None:
     """Creates a directory structure similar to the one created by `lean init` with a Python and a C# project,
     and a Python and a C# library"""
-    (Path.cwd() / "data").mkdir()
+    create_fake_lean_cli_directory_from_files(get_fake_lean_cli_directory_files(PurePath()))
 
-    files = {
-        (Path.cwd() / "lean.json"): _get_lean_config_file_content(),
-        **_get_python_project_files(Path.cwd() / "Python Project"),
-        **_get_csharp_project_files(Path.cwd() / "CSharp Project"),
-        **_get_fake_libraries()
-    }
 
-    _write_fake_directory(files)
+def create_fake_lean_cli_directory_from_files(files: Dict[PurePath, str]) -> None:
+    """Creates a directory structure in the cwd from files returned by get_fake_lean_cli_directory_files(PurePath()).
+
+    This makes it possible to render the files once and write them in every test that needs them.
+    """
+    (Path.cwd() / "data").mkdir()
+
+    _write_fake_directory({(Path.cwd() / path): content for path, content in files.items()})
 
 def create_fake_lean_cli_project(name: str, language: str) -> None:
     """Creates a directory structure similar to the one created by `lean init` with a given project info"""
@@ -130,7 +142,7 @@ def create_fake_lean_cli_directory_with_subdirectories(depth: int) -> None:
         (Path.cwd() / "lean.json"): _get_lean_config_file_content(),
         **_get_python_project_files(python_project_dir),
         **_get_csharp_project_files(csharp_project_dir),
-        **_get_fake_libraries()
+        **_get_fake_libraries(Path.cwd())
     }
 
     _write_fake_directory(files)